@@ -21,11 +21,33 @@ Modes:
 """
 
 import json
+import math
 import sys
 import argparse
 import re
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
+
+from read_session_core import MODE_FIELDS, MODE_LINE_FILTERS, Turn, load_session
+
+# Tool-call arguments are dumped compactly; orjson does it in C when present.
+try:
+    import orjson
+
+    def dumps_compact(obj) -> str:
+        try:
+            return orjson.dumps(obj).decode()
+        except TypeError:
+            # Integers past 64 bits or lone surrogates, which stdlib json decodes
+            # but orjson refuses to encode; escape to ASCII so it stays printable.
+            return json.dumps(obj, separators=(",", ":"))
+except ImportError:
+
+    def dumps_compact(obj) -> str:
+        # ASCII escaping keeps lone surrogates printable, as in the orjson fallback.
+        return json.dumps(obj, separators=(",", ":"))
 
 
 def parse_args():
@@ -47,6 +69,17 @@ def parse_args():
         help="Max chars per content block (default: 3000, 0=unlimited)",
     )
     parser.add_argument("--search", type=str, default="", help="Filter turns containing this text (case-insensitive)")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Decode sessions of 32MB+ in N processes (0=one per CPU; default: 1, serial)",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse a cached full parse across runs (~/.cache/pi-session-reader); written by turn/full modes",
+    )
     return parser.parse_args()
 
 
@@ -56,7 +89,41 @@ def truncate(text: str, max_len: int) -> str:
     return text[:max_len] + f"\n... [truncated, {len(text):,} chars total]"
 
 
+def join_truncated(parts: list[str], limit: int) -> str:
+    """Return " ".join(parts)[:limit] without joining anything past the limit."""
+    out = []
+    n = 0
+    for i, part in enumerate(parts):
+        if i:
+            out.append(" ")
+            n += 1
+        if n >= limit:
+            break
+        out.append(part[:limit - n])
+        n += len(out[-1])
+    return "".join(out)[:limit]
+
+
+def truncate_joined(parts: list[str], max_len: int) -> str:
+    """Same as truncate(" ".join(parts), max_len), built from the parts."""
+    total = sum(map(len, parts)) + max(len(parts) - 1, 0)
+    if max_len <= 0 or total <= max_len:
+        return " ".join(parts)
+    return join_truncated(parts, max_len) + f"\n... [truncated, {total:,} chars total]"
+
+
 def format_timestamp(ts) -> str:
+    # Millisecond floats are bucketed to ints so near-identical values share a
+    # cache entry; the output only has second resolution anyway.
+    if isinstance(ts, float) and math.isfinite(ts):
+        ts = int(ts)
+    if isinstance(ts, (int, float, str)):
+        return _format_timestamp(ts)
+    return _format_timestamp.__wrapped__(ts)
+
+
+@lru_cache(maxsize=4096)
+def _format_timestamp(ts) -> str:
     if not ts:
         return "?"
     try:
@@ -70,7 +137,13 @@ def format_timestamp(ts) -> str:
 
 
 def format_duration(ms: int | float) -> str:
-    secs = int(ms / 1000)
+    # Reduce to whole seconds before the cache lookup so float durations that
+    # render identically share one entry.
+    return _format_duration(int(ms / 1000))
+
+
+@lru_cache(maxsize=1024)
+def _format_duration(secs: int) -> str:
     if secs < 60:
         return f"{secs}s"
     mins = secs // 60
@@ -78,116 +151,14 @@ def format_duration(ms: int | float) -> str:
     return f"{mins}m{secs}s"
 
 
-def parse_session(path: str) -> tuple[dict, list[dict], list[dict]]:
-    """Parse a session file into (metadata, events, messages)."""
-    metadata = {}
-    events = []
-    messages = []
-
-    with open(path) as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            obj = json.loads(line)
-            t = obj.get("type")
-
-            if t == "session":
-                metadata = obj
-            elif t in ("model_change", "thinking_level_change"):
-                events.append(obj)
-            elif t == "message":
-                messages.append(obj)
-
-    return metadata, events, messages
-
-
-def extract_subagent_details(msg: dict) -> dict | None:
-    if msg.get("role") != "toolResult" or msg.get("toolName") != "subagent":
-        return None
-    return msg.get("details")
-
-
-def extract_turns(messages: list[dict]) -> list[dict]:
-    """Convert raw message entries into structured turns."""
-    turns = []
-
-    for entry in messages:
-        msg = entry.get("message", {})
-        role = msg.get("role", "")
-        content = msg.get("content", "")
-        timestamp = entry.get("timestamp", msg.get("timestamp", ""))
-
-        turn = {
-            "role": role,
-            "timestamp": timestamp,
-            "texts": [],
-            "tool_calls": [],
-            "thinking": [],
-            "is_error": msg.get("isError", False),
-        }
-
-        if role == "assistant":
-            usage = msg.get("usage", {})
-            if usage:
-                turn["model"] = msg.get("model", "")
-                turn["provider"] = msg.get("provider", "")
-                turn["usage"] = usage
-                turn["stop_reason"] = msg.get("stopReason", "")
-
-        if isinstance(content, str):
-            if content.strip():
-                turn["texts"].append(content)
-        elif isinstance(content, list):
-            for item in content:
-                if not isinstance(item, dict):
-                    continue
-                item_type = item.get("type", "")
-
-                if item_type == "text" and item.get("text", "").strip():
-                    turn["texts"].append(item["text"])
-                elif item_type == "toolCall":
-                    turn["tool_calls"].append(
-                        {
-                            "id": item.get("id", ""),
-                            "name": item.get("name", ""),
-                            "arguments": item.get("arguments", {}),
-                        }
-                    )
-                elif item_type == "thinking":
-                    thinking_text = item.get("thinking", "")
-                    if thinking_text:
-                        turn["thinking"].append(thinking_text)
-
-        if role == "toolResult":
-            turn["tool_call_id"] = msg.get("toolCallId", "")
-            turn["tool_name"] = msg.get("toolName", "")
-            turn["texts"] = []
-            result_content = msg.get("content", "")
-            if isinstance(result_content, list):
-                for item in result_content:
-                    if isinstance(item, dict) and item.get("type") == "text":
-                        turn["texts"].append(item.get("text", ""))
-            elif isinstance(result_content, str) and result_content.strip():
-                turn["texts"].append(result_content)
-
-            subagent_details = extract_subagent_details(msg)
-            if subagent_details:
-                turn["subagent_details"] = subagent_details
-
-        turns.append(turn)
-
-    return turns
-
-
-def group_into_exchanges(turns: list[dict]) -> list[dict]:
+def group_into_exchanges(turns: list[Turn]) -> list[dict]:
     """Group turns into user exchanges. Each exchange = one user message + all
     assistant responses and tool results until the next user message."""
     exchanges = []
     current = None
 
     for turn in turns:
-        if turn["role"] == "user":
+        if turn.role == "user":
             if current:
                 exchanges.append(current)
             current = {
@@ -209,13 +180,13 @@ def exchange_matches_search(exchange: dict, search: str) -> bool:
         return True
     search_lower = search.lower()
     # Check user text
-    for t in exchange["user"]["texts"]:
+    for t in exchange["user"].texts:
         if search_lower in t.lower():
             return True
     # Check assistant texts
     for resp in exchange["responses"]:
-        if resp["role"] == "assistant":
-            for t in resp["texts"]:
+        if resp.role == "assistant":
+            for t in resp.texts:
                 if search_lower in t.lower():
                     return True
     return False
@@ -224,7 +195,14 @@ def exchange_matches_search(exchange: dict, search: str) -> bool:
 def apply_filters(exchanges: list[dict], args) -> list[dict]:
     """Apply search, offset, and limit filters."""
     if args.search:
-        exchanges = [e for e in exchanges if exchange_matches_search(e, args.search)]
+        matches = (e for e in exchanges if exchange_matches_search(e, args.search))
+        if args.offset < 0 or args.limit < 0:
+            # Negative values slice from the end, so every match is needed.
+            exchanges = list(matches)
+        else:
+            # Search lazily so matching stops once offset + limit hits are found.
+            stop = args.offset + args.limit if args.limit else None
+            return list(islice(matches, args.offset, stop))
     if args.offset:
         exchanges = exchanges[args.offset:]
     if args.limit:
@@ -232,6 +210,13 @@ def apply_filters(exchanges: list[dict], args) -> list[dict]:
     return exchanges
 
 
+@lru_cache(maxsize=4096)
+def path_exists(path: str) -> bool:
+    """Memoized Path.exists(); subagent session and artifact paths are probed
+    repeatedly, and the filesystem is treated as static for one run."""
+    return Path(path).exists()
+
+
 def format_subagent_summary(details: dict) -> str:
     mode = details.get("mode", "?")
     results = details.get("results", [])
@@ -260,25 +245,60 @@ def format_subagent_summary(details: dict) -> str:
     return header + "\n" + "\n".join(parts)
 
 
+def session_totals(turns: list[Turn]) -> dict:
+    """Aggregate session and subagent cost/token totals in a single pass."""
+    total_cost = 0
+    total_input = 0
+    total_output = 0
+    subagent_cost = 0
+    subagent_count = 0
+
+    for t in turns:
+        usage = t.usage
+        if usage:
+            total_cost += usage.get("cost", {}).get("total", 0)
+            total_input += usage.get("input", 0)
+            total_output += usage.get("output", 0)
+        details = t.subagent_details
+        if details:
+            subagent_count += 1
+            for r in details.get("results", []):
+                subagent_cost += r.get("usage", {}).get("cost", 0)
+
+    return {
+        "cost": total_cost,
+        "input": total_input,
+        "output": total_output,
+        "subagent_cost": subagent_cost,
+        "subagent_count": subagent_count,
+    }
+
+
 # ─── Modes ───────────────────────────────────────────────────────────────────
 
+SEP_DOUBLE70 = "═" * 70
+SEP_DOUBLE60 = "═" * 60
+SEP_LIGHT80 = "─" * 80
+SEP_LIGHT70 = "─" * 70
+SEP_LIGHT50 = "─" * 50
+SEP_HEAVY60 = "━" * 60
+TOC_HEADER_RULE = f"{'─' * 5} {'─' * 9} {'─' * 42} {'─' * 14}"
+
 
 def print_conversation(exchanges: list[dict], args):
     """Default mode: just user and assistant text. Clean, readable, no noise."""
     total = len(exchanges)
-    print(f"{'═' * 70}")
+    print(SEP_DOUBLE70)
     print(f"CONVERSATION — {total} exchanges")
-    print(f"{'═' * 70}")
+    print(SEP_DOUBLE70)
 
     filtered = apply_filters(exchanges, args)
 
     for ex in filtered:
         n = ex["number"]
-        ts = format_timestamp(ex["user"]["timestamp"])
-        print(f"\n{'─' * 70}")
-        print(f"#{n}  👤 USER  [{ts}]")
-        print(f"{'─' * 70}")
-        for text in ex["user"]["texts"]:
+        ts = format_timestamp(ex["user"].timestamp)
+        print(f"\n{SEP_LIGHT70}\n#{n}  👤 USER  [{ts}]\n{SEP_LIGHT70}")
+        for text in ex["user"].texts:
             print(truncate(text, args.max_content))
 
         # Collect all assistant text blocks for this exchange
@@ -287,14 +307,14 @@ def print_conversation(exchanges: list[dict], args):
         tool_names = set()
         subagent_summaries = []
         for resp in ex["responses"]:
-            if resp["role"] == "assistant":
-                assistant_texts.extend(resp["texts"])
-                if resp["tool_calls"]:
+            if resp.role == "assistant":
+                assistant_texts.extend(resp.texts)
+                if resp.tool_calls:
                     has_tools = True
-                    for tc in resp["tool_calls"]:
+                    for tc in resp.tool_calls:
                         tool_names.add(tc["name"])
-            elif resp["role"] == "toolResult" and resp.get("subagent_details"):
-                subagent_summaries.append(format_subagent_summary(resp["subagent_details"]))
+            elif resp.role == "toolResult" and resp.subagent_details:
+                subagent_summaries.append(format_subagent_summary(resp.subagent_details))
 
         if assistant_texts:
             # Show tool usage as a compact hint
@@ -315,12 +335,12 @@ def print_conversation(exchanges: list[dict], args):
                 print("\n🤖 ASSISTANT  (no text response)")
 
 
-def print_toc(metadata: dict, events: list[dict], exchanges: list[dict], turns: list[dict], args):
+def print_toc(metadata: dict, events: list[dict], exchanges: list[dict], turns: list[Turn], args):
     """Compact table of contents — numbered exchanges for navigation."""
     # Header
-    print(f"{'═' * 70}")
+    print(SEP_DOUBLE70)
     print(f"TABLE OF CONTENTS")
-    print(f"{'═' * 70}")
+    print(SEP_DOUBLE70)
     print(f"  Session:  {metadata.get('id', 'N/A')[:12]}...")
     print(f"  CWD:      {metadata.get('cwd', 'N/A')}")
     print(f"  Started:  {metadata.get('timestamp', 'N/A')}")
@@ -330,12 +350,9 @@ def print_toc(metadata: dict, events: list[dict], exchanges: list[dict], turns:
             print(f"  Model:    {evt.get('provider', '')}/{evt.get('modelId', '')}")
 
     # Cost summary
-    total_cost = sum(t.get("usage", {}).get("cost", {}).get("total", 0) for t in turns if t.get("usage"))
-    subagent_cost = sum(
-        r.get("usage", {}).get("cost", 0)
-        for t in turns if t.get("subagent_details")
-        for r in t["subagent_details"].get("results", [])
-    )
+    totals = session_totals(turns)
+    total_cost = totals["cost"]
+    subagent_cost = totals["subagent_cost"]
     if total_cost > 0:
         cost_str = f"${total_cost:.4f}"
         if subagent_cost > 0:
@@ -347,21 +364,21 @@ def print_toc(metadata: dict, events: list[dict], exchanges: list[dict], turns:
 
     # Table
     print(f"{'#':<5} {'Time':<9} {'User message':<42} {'Tools':<14}")
-    print(f"{'─' * 5} {'─' * 9} {'─' * 42} {'─' * 14}")
+    print(TOC_HEADER_RULE)
 
     filtered = apply_filters(exchanges, args)
 
     for ex in filtered:
         n = ex["number"]
-        ts = format_timestamp(ex["user"]["timestamp"])
-        user_text = " ".join(ex["user"]["texts"])[:40].replace("\n", " ")
+        ts = format_timestamp(ex["user"].timestamp)
+        user_text = join_truncated(ex["user"].texts, 40).replace("\n", " ")
 
         tool_names = set()
         for resp in ex["responses"]:
-            if resp["role"] == "assistant":
-                for tc in resp["tool_calls"]:
+            if resp.role == "assistant":
+                for tc in resp.tool_calls:
                     tool_names.add(tc["name"])
-            if resp.get("subagent_details"):
+            if resp.subagent_details:
                 tool_names.add("subagent")
 
         tools_str = ", ".join(sorted(tool_names))[:14] if tool_names else "—"
@@ -370,7 +387,7 @@ def print_toc(metadata: dict, events: list[dict], exchanges: list[dict], turns:
     print(f"\nUse --mode turn --turn N to drill into a specific exchange.")
 
 
-def print_turn_detail(exchanges: list[dict], turns: list[dict], args):
+def print_turn_detail(exchanges: list[dict], turns: list[Turn], args):
     """Deep dive into a specific exchange — everything visible."""
     turn_num = args.turn
     if turn_num < 1 or turn_num > len(exchanges):
@@ -378,73 +395,67 @@ def print_turn_detail(exchanges: list[dict], turns: list[dict], args):
         sys.exit(1)
 
     ex = exchanges[turn_num - 1]
-    ts = format_timestamp(ex["user"]["timestamp"])
+    ts = format_timestamp(ex["user"].timestamp)
 
-    print(f"{'═' * 70}")
+    print(SEP_DOUBLE70)
     print(f"TURN #{turn_num} DETAIL")
-    print(f"{'═' * 70}")
+    print(SEP_DOUBLE70)
 
     # User message
-    print(f"\n{'─' * 50}")
-    print(f"👤 USER [{ts}]")
-    print(f"{'─' * 50}")
-    for text in ex["user"]["texts"]:
+    print(f"\n{SEP_LIGHT50}\n👤 USER [{ts}]\n{SEP_LIGHT50}")
+    for text in ex["user"].texts:
         print(truncate(text, args.max_content))
 
     # All responses in order
     step = 0
     for resp in ex["responses"]:
-        if resp["role"] == "assistant":
+        if resp.role == "assistant":
             step += 1
-            ts = format_timestamp(resp["timestamp"])
-            model = resp.get("model", "")
-            usage = resp.get("usage", {})
+            ts = format_timestamp(resp.timestamp)
+            model = resp.model
+            usage = (resp.usage or {})
             cost = usage.get("cost", {})
             cost_str = f" ${cost.get('total', 0):.4f}" if cost.get("total") else ""
 
-            print(f"\n{'─' * 50}")
-            print(f"🤖 STEP {step} [{ts}]{f'  model:{model}' if model else ''}{cost_str}")
-            print(f"{'─' * 50}")
+            print(f"\n{SEP_LIGHT50}\n🤖 STEP {step} [{ts}]{f'  model:{model}' if model else ''}{cost_str}\n{SEP_LIGHT50}")
 
-            if resp["thinking"]:
-                for thought in resp["thinking"]:
+            if resp.thinking:
+                for thought in resp.thinking:
                     print(f"\n💭 THINKING:")
                     print(truncate(thought, args.max_content))
 
-            for text in resp["texts"]:
+            for text in resp.texts:
                 print(truncate(text, args.max_content))
 
-            for tc in resp["tool_calls"]:
+            for tc in resp.tool_calls:
                 args_str = json.dumps(tc["arguments"], indent=2)
-                print(f"\n  🔧 {tc['name']}")
-                print(f"  {truncate(args_str, args.max_content)}")
+                print(f"\n  🔧 {tc['name']}\n  {truncate(args_str, args.max_content)}")
 
-        elif resp["role"] == "toolResult":
-            details = resp.get("subagent_details")
+        elif resp.role == "toolResult":
+            details = resp.subagent_details
             if details:
                 print(f"\n  {format_subagent_summary(details)}")
                 for r in details.get("results", []):
                     sf = r.get("sessionFile", "")
                     ap = r.get("artifactPaths", {})
                     if sf:
-                        exists = Path(sf).exists()
+                        exists = path_exists(sf)
                         print(f"    📁 session: {sf}{'' if exists else ' (deleted)'}")
                     if ap.get("jsonlPath"):
-                        exists = Path(ap["jsonlPath"]).exists()
+                        exists = path_exists(ap["jsonlPath"])
                         print(f"    📁 jsonl: {ap['jsonlPath']}{'' if exists else ' (deleted)'}")
             else:
-                err = " ❌" if resp["is_error"] else ""
-                tool = resp.get("tool_name", "?")
-                text = " ".join(resp["texts"])
+                err = " ❌" if resp.is_error else ""
+                tool = resp.tool_name
                 print(f"\n  ↳ {tool}{err}:")
-                print(f"  {truncate(text, args.max_content)}")
+                print(f"  {truncate_joined(resp.texts, args.max_content)}")
 
 
-def print_overview(metadata: dict, events: list[dict], exchanges: list[dict], turns: list[dict], args):
+def print_overview(metadata: dict, events: list[dict], exchanges: list[dict], turns: list[Turn], args):
     """Session metadata and exchange-level summary."""
-    print(f"{'═' * 70}")
+    print(SEP_DOUBLE70)
     print("SESSION OVERVIEW")
-    print(f"{'═' * 70}")
+    print(SEP_DOUBLE70)
     print(f"  ID:       {metadata.get('id', 'N/A')}")
     print(f"  CWD:      {metadata.get('cwd', 'N/A')}")
     print(f"  Started:  {metadata.get('timestamp', 'N/A')}")
@@ -456,16 +467,12 @@ def print_overview(metadata: dict, events: list[dict], exchanges: list[dict], tu
         elif evt["type"] == "thinking_level_change":
             print(f"  Thinking: {evt.get('thinkingLevel', '')}")
 
-    total_cost = sum(t.get("usage", {}).get("cost", {}).get("total", 0) for t in turns if t.get("usage"))
-    total_input = sum(t.get("usage", {}).get("input", 0) for t in turns if t.get("usage"))
-    total_output = sum(t.get("usage", {}).get("output", 0) for t in turns if t.get("usage"))
-
-    subagent_cost = sum(
-        r.get("usage", {}).get("cost", 0)
-        for t in turns if t.get("subagent_details")
-        for r in t["subagent_details"].get("results", [])
-    )
-    subagent_count = sum(1 for t in turns if t.get("subagent_details"))
+    totals = session_totals(turns)
+    total_cost = totals["cost"]
+    total_input = totals["input"]
+    total_output = totals["output"]
+    subagent_cost = totals["subagent_cost"]
+    subagent_count = totals["subagent_count"]
 
     if total_cost > 0:
         print(f"  Cost:     ${total_cost:.4f}  ({total_input + total_output:,} tokens)")
@@ -477,75 +484,73 @@ def print_overview(metadata: dict, events: list[dict], exchanges: list[dict], tu
     print()
 
     # Exchange summary
-    print(f"{'─' * 70}")
+    print(SEP_LIGHT70)
     print("EXCHANGES")
-    print(f"{'─' * 70}")
+    print(SEP_LIGHT70)
 
     filtered = apply_filters(exchanges, args)
 
     for ex in filtered:
         n = ex["number"]
-        ts = format_timestamp(ex["user"]["timestamp"])
-        user_text = " ".join(ex["user"]["texts"])[:200].replace("\n", " ")
+        ts = format_timestamp(ex["user"].timestamp)
+        user_text = join_truncated(ex["user"].texts, 200).replace("\n", " ")
         print(f"\n[{ts}] #{n} 👤 {user_text}")
 
         for resp in ex["responses"]:
-            ts2 = format_timestamp(resp["timestamp"])
-            if resp["role"] == "assistant":
+            if resp.role == "assistant":
+                ts2 = format_timestamp(resp.timestamp)
                 parts = []
-                if resp["texts"]:
-                    preview = resp["texts"][0][:120].replace("\n", " ")
+                if resp.texts:
+                    preview = resp.texts[0][:120].replace("\n", " ")
                     parts.append(f'"{preview}"')
-                if resp["tool_calls"]:
-                    tool_names = [tc["name"] for tc in resp["tool_calls"]]
+                if resp.tool_calls:
+                    tool_names = [tc["name"] for tc in resp.tool_calls]
                     parts.append(f"tools:[{','.join(tool_names)}]")
-                cost = resp.get("usage", {}).get("cost", {})
+                cost = (resp.usage or {}).get("cost", {})
                 cost_str = f" ${cost.get('total', 0):.4f}" if cost.get("total") else ""
                 summary = " | ".join(parts) if parts else "(empty)"
                 print(f"  [{ts2}] 🤖 {summary}{cost_str}")
-            elif resp["role"] == "toolResult":
-                details = resp.get("subagent_details")
+            elif resp.role == "toolResult":
+                ts2 = format_timestamp(resp.timestamp)
+                details = resp.subagent_details
                 if details:
                     print(f"  [{ts2}] {format_subagent_summary(details)}")
                 else:
-                    text = " ".join(resp["texts"])[:80].replace("\n", " ")
-                    err = " ❌" if resp["is_error"] else ""
-                    print(f"  [{ts2}]   ↳ {resp.get('tool_name', '?')}{err}: {text}")
+                    text = join_truncated(resp.texts, 80).replace("\n", " ")
+                    err = " ❌" if resp.is_error else ""
+                    print(f"  [{ts2}]   ↳ {resp.tool_name}{err}: {text}")
 
 
 def print_full(exchanges: list[dict], args):
     """Everything including tool calls and results."""
-    print(f"{'═' * 70}")
+    print(SEP_DOUBLE70)
     print("FULL SESSION")
-    print(f"{'═' * 70}")
+    print(SEP_DOUBLE70)
 
     filtered = apply_filters(exchanges, args)
 
     for ex in filtered:
         n = ex["number"]
-        ts = format_timestamp(ex["user"]["timestamp"])
-        print(f"\n{'═' * 60}")
-        print(f"#{n}  👤 USER [{ts}]")
-        print(f"{'═' * 60}")
-        for text in ex["user"]["texts"]:
+        ts = format_timestamp(ex["user"].timestamp)
+        print(f"\n{SEP_DOUBLE60}\n#{n}  👤 USER [{ts}]\n{SEP_DOUBLE60}")
+        for text in ex["user"].texts:
             print(truncate(text, args.max_content))
 
         for resp in ex["responses"]:
-            ts2 = format_timestamp(resp["timestamp"])
-            if resp["role"] == "assistant":
-                model = resp.get("model", "")
+            if resp.role == "assistant":
+                ts2 = format_timestamp(resp.timestamp)
+                model = resp.model
                 print(f"\n🤖 ASSISTANT [{ts2}]{f' ({model})' if model else ''}")
-                if resp["thinking"]:
-                    for thought in resp["thinking"]:
+                if resp.thinking:
+                    for thought in resp.thinking:
                         print(f"\n  💭 THINKING: {truncate(thought, args.max_content)}")
-                for text in resp["texts"]:
+                for text in resp.texts:
                     print(truncate(text, args.max_content))
-                for tc in resp["tool_calls"]:
-                    args_str = json.dumps(tc["arguments"])
-                    print(f"\n  🔧 {tc['name']}")
-                    print(f"     {truncate(args_str, args.max_content)}")
-            elif resp["role"] == "toolResult":
-                details = resp.get("subagent_details")
+                for tc in resp.tool_calls:
+                    args_str = dumps_compact(tc["arguments"])
+                    print(f"\n  🔧 {tc['name']}\n     {truncate(args_str, args.max_content)}")
+            elif resp.role == "toolResult":
+                details = resp.subagent_details
                 if details:
                     print(f"\n  {format_subagent_summary(details)}")
                     for r in details.get("results", []):
@@ -556,55 +561,56 @@ def print_full(exchanges: list[dict], args):
                         if ap.get("jsonlPath"):
                             print(f"    📁 jsonl: {ap['jsonlPath']}")
                 else:
-                    err = " ❌" if resp["is_error"] else ""
-                    print(f"\n  ↳ {resp.get('tool_name', '?')}{err}:")
-                    for text in resp["texts"]:
+                    err = " ❌" if resp.is_error else ""
+                    print(f"\n  ↳ {resp.tool_name}{err}:")
+                    for text in resp.texts:
                         print(f"     {truncate(text, args.max_content)}")
 
 
 def print_tools(exchanges: list[dict], args):
     """Tool calls and results only."""
-    print(f"{'═' * 70}")
+    print(SEP_DOUBLE70)
     print("TOOL CALLS")
-    print(f"{'═' * 70}")
+    print(SEP_DOUBLE70)
 
     filtered = apply_filters(exchanges, args)
     tool_num = 0
 
     for ex in filtered:
         for resp in ex["responses"]:
-            if resp["role"] == "assistant" and resp["tool_calls"]:
-                ts = format_timestamp(resp["timestamp"])
-                for tc in resp["tool_calls"]:
+            if resp.role == "assistant" and resp.tool_calls:
+                ts = format_timestamp(resp.timestamp)
+                for tc in resp.tool_calls:
                     tool_num += 1
-                    args_str = json.dumps(tc["arguments"])
-                    print(f"\n[{ts}] #{tool_num} {tc['name']}  (exchange #{ex['number']})")
-                    print(f"  args: {truncate(args_str, args.max_content)}")
-            elif resp["role"] == "toolResult":
-                details = resp.get("subagent_details")
+                    args_str = dumps_compact(tc["arguments"])
+                    print(
+                        f"\n[{ts}] #{tool_num} {tc['name']}  (exchange #{ex['number']})\n"
+                        f"  args: {truncate(args_str, args.max_content)}"
+                    )
+            elif resp.role == "toolResult":
+                details = resp.subagent_details
                 if details:
                     print(f"  {format_subagent_summary(details)}")
                 else:
-                    err = " ❌" if resp["is_error"] else " ✓"
-                    text = " ".join(resp["texts"])
-                    print(f"  result{err}: {truncate(text, min(args.max_content, 500))}")
+                    err = " ❌" if resp.is_error else " ✓"
+                    print(f"  result{err}: {truncate_joined(resp.texts, min(args.max_content, 500))}")
 
 
-def print_costs(turns: list[dict], args):
+def print_costs(turns: list[Turn], args):
     """Cost breakdown per assistant turn."""
-    print(f"{'═' * 70}")
+    print(SEP_DOUBLE70)
     print("COST BREAKDOWN")
-    print(f"{'═' * 70}")
+    print(SEP_DOUBLE70)
     print(f"{'#':<4} {'Time':<10} {'Model':<30} {'In':>8} {'Out':>8} {'Cache':>8} {'Cost':>10}")
-    print("─" * 80)
+    print(SEP_LIGHT80)
 
     total_cost = 0
     turn_num = 0
     assistant_num = 0
     for turn in turns:
-        if turn["role"] == "user":
+        if turn.role == "user":
             turn_num += 1
-        if turn["role"] != "assistant" or not turn.get("usage"):
+        if turn.role != "assistant" or not turn.usage:
             continue
 
         assistant_num += 1
@@ -613,12 +619,12 @@ def print_costs(turns: list[dict], args):
         if args.limit and turn_num > args.offset + args.limit:
             break
 
-        usage = turn["usage"]
+        usage = turn.usage
         cost = usage.get("cost", {})
         total = cost.get("total", 0)
         total_cost += total
-        ts = format_timestamp(turn["timestamp"])
-        model = turn.get("model", "?")
+        ts = format_timestamp(turn.timestamp)
+        model = turn.model
 
         print(
             f"{assistant_num:<4} {ts:<10} {model:<30} "
@@ -629,7 +635,7 @@ def print_costs(turns: list[dict], args):
     subagent_cost = 0
     sub_num = 0
     for turn in turns:
-        details = turn.get("subagent_details")
+        details = turn.subagent_details
         if not details:
             continue
         for r in details.get("results", []):
@@ -648,7 +654,7 @@ def print_costs(turns: list[dict], args):
                 f"{cache:>8,} ${cost:>9.4f}"
             )
 
-    print("─" * 80)
+    print(SEP_LIGHT80)
     grand_total = total_cost + subagent_cost
     if subagent_cost > 0:
         print(f"{'SESSION':<54} ${total_cost:>9.4f}")
@@ -656,38 +662,26 @@ def print_costs(turns: list[dict], args):
     print(f"{'TOTAL':<54} ${grand_total:>9.4f}")
 
 
-def print_subagents(turns: list[dict], messages: list[dict], args):
+def print_subagents(turns: list[Turn], args):
     """Detailed subagent information."""
-    print(f"{'═' * 70}")
+    print(SEP_DOUBLE70)
     print("SUBAGENT RUNS")
-    print(f"{'═' * 70}")
+    print(SEP_DOUBLE70)
 
     sub_num = 0
     found_any = False
 
-    for i, entry in enumerate(messages):
-        msg = entry.get("message", {})
-        details = extract_subagent_details(msg)
+    for turn in turns:
+        details = turn.subagent_details
         if not details:
             continue
 
         found_any = True
         mode = details.get("mode", "?")
         results = details.get("results", [])
+        call_args = turn.subagent_call_args or {}
 
-        call_args = {}
-        for j in range(i - 1, max(i - 5, -1), -1):
-            prev_msg = messages[j].get("message", {})
-            prev_content = prev_msg.get("content", [])
-            if isinstance(prev_content, list):
-                for item in prev_content:
-                    if isinstance(item, dict) and item.get("type") == "toolCall" and item.get("name") == "subagent":
-                        call_args = item.get("arguments", {})
-                        break
-
-        print(f"\n{'━' * 60}")
-        print(f"INVOCATION #{sub_num + 1} — mode: {mode}")
-        print(f"{'━' * 60}")
+        print(f"\n{SEP_HEAVY60}\nINVOCATION #{sub_num + 1} — mode: {mode}\n{SEP_HEAVY60}")
 
         if call_args.get("chain"):
             print(f"  Chain steps: {len(call_args['chain'])}")
@@ -732,13 +726,13 @@ def print_subagents(turns: list[dict], messages: list[dict], args):
             print(f"  Tools:    {tool_count} calls in {turns_count} turns")
 
             if session_file:
-                exists = Path(session_file).exists()
+                exists = path_exists(session_file)
                 print(f"  Session:  {session_file}{'' if exists else ' (deleted)'}")
             if artifact_paths.get("jsonlPath"):
-                exists = Path(artifact_paths["jsonlPath"]).exists()
+                exists = path_exists(artifact_paths["jsonlPath"])
                 print(f"  JSONL:    {artifact_paths['jsonlPath']}{'' if exists else ' (deleted)'}")
             if artifact_paths.get("outputPath"):
-                exists = Path(artifact_paths["outputPath"]).exists()
+                exists = path_exists(artifact_paths["outputPath"])
                 print(f"  Output:   {artifact_paths['outputPath']}{'' if exists else ' (deleted)'}")
 
         if len(results) > 1:
@@ -782,14 +776,14 @@ def find_issues(exchanges: list[dict]) -> list[dict]:
 
         # 1. Tool errors
         for resp in ex["responses"]:
-            if resp["role"] == "toolResult" and resp["is_error"]:
-                tool = resp.get("tool_name", "?")
-                text = " ".join(resp["texts"])[:300].replace("\n", " ")
+            if resp.role == "toolResult" and resp.is_error:
+                tool = resp.tool_name
+                text = join_truncated(resp.texts, 300).replace("\n", " ")
                 exchange_issues.append({"type": "tool_error", "tool": tool, "text": text})
 
         # 2. Failed subagents
         for resp in ex["responses"]:
-            details = resp.get("subagent_details")
+            details = resp.subagent_details
             if not details:
                 continue
             for r in details.get("results", []):
@@ -800,9 +794,9 @@ def find_issues(exchanges: list[dict]) -> list[dict]:
 
         # 3. Assistant retry/correction language
         for resp in ex["responses"]:
-            if resp["role"] != "assistant":
+            if resp.role != "assistant":
                 continue
-            for text in resp["texts"]:
+            for text in resp.texts:
                 for pattern in RETRY_PATTERNS:
                     if re.search(pattern, text[:500]):
                         snippet = text[:200].replace("\n", " ")
@@ -810,7 +804,7 @@ def find_issues(exchanges: list[dict]) -> list[dict]:
                         break  # one match per text block is enough
 
         # 4. User flagging something broken
-        user_text = " ".join(ex["user"]["texts"]).lower()
+        user_text = " ".join(ex["user"].texts).lower()
         user_flags = [
             "doesn't work", "didn't work", "not working", "broken",
             "failed", "error", "bug", "wrong", "issue", "problem",
@@ -831,9 +825,9 @@ def print_issues(exchanges: list[dict], args):
     """Surface everything that went wrong: errors, failures, retries."""
     issues = find_issues(exchanges)
 
-    print(f"{'═' * 70}")
+    print(SEP_DOUBLE70)
     print(f"ISSUES — {len(issues)} exchanges with problems (out of {len(exchanges)} total)")
-    print(f"{'═' * 70}")
+    print(SEP_DOUBLE70)
 
     if not issues:
         print("\n  ✅ No issues found — clean session.")
@@ -842,12 +836,10 @@ def print_issues(exchanges: list[dict], args):
     for item in issues:
         ex = item["exchange"]
         n = ex["number"]
-        ts = format_timestamp(ex["user"]["timestamp"])
-        user_text = " ".join(ex["user"]["texts"])[:120].replace("\n", " ")
+        ts = format_timestamp(ex["user"].timestamp)
+        user_text = join_truncated(ex["user"].texts, 120).replace("\n", " ")
 
-        print(f"\n{'─' * 70}")
-        print(f"#{n}  [{ts}]  👤 {user_text}")
-        print(f"{'─' * 70}")
+        print(f"\n{SEP_LIGHT70}\n#{n}  [{ts}]  👤 {user_text}\n{SEP_LIGHT70}")
 
         for issue in item["issues"]:
             t = issue["type"]
@@ -866,14 +858,14 @@ def print_issues(exchanges: list[dict], args):
         # Show assistant's final response for this exchange
         final_texts = []
         for resp in reversed(ex["responses"]):
-            if resp["role"] == "assistant" and resp["texts"]:
-                final_texts = resp["texts"]
+            if resp.role == "assistant" and resp.texts:
+                final_texts = resp.texts
                 break
         if final_texts:
             last = final_texts[-1][:300].replace("\n", " ")
             print(f"\n  💬 Final response: {last}")
 
-    print(f"\n{'═' * 70}")
+    print(f"\n{SEP_DOUBLE70}")
     print(f"Drill into any exchange: --mode turn --turn N")
 
 
@@ -885,10 +877,19 @@ def main():
         print(f"Error: Session file not found: {path}", file=sys.stderr)
         sys.exit(1)
 
-    metadata, events, messages = parse_session(str(path))
-    turns = extract_turns(messages)
+    metadata, events, turns = load_session(
+        str(path),
+        MODE_FIELDS[args.mode],
+        MODE_LINE_FILTERS.get(args.mode),
+        use_cache=args.cache,
+        workers=args.jobs,
+    )
     exchanges = group_into_exchanges(turns)
 
+    # Printers emit many short lines; on a terminal stdout is line-buffered,
+    # which turns each one into a separate write. Buffer in blocks instead.
+    sys.stdout.reconfigure(line_buffering=False, write_through=False)
+
     if args.mode == "conversation":
         print_conversation(exchanges, args)
     elif args.mode == "toc":
@@ -909,7 +910,7 @@ def main():
     elif args.mode == "costs":
         print_costs(turns, args)
     elif args.mode == "subagents":
-        print_subagents(turns, messages, args)
+        print_subagents(turns, args)
 
 
 if __name__ == "__main__":
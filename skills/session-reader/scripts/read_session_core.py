@@ -0,0 +1,439 @@
+"""
+Session parsing core for read_session.py: JSONL reading and turn extraction.
+
+This is the hot path on large sessions and is kept free of CLI and printing
+code so it can optionally be compiled to a C extension with mypyc:
+
+    uv run --with mypy mypyc read_session_core.py
+
+The compiled module is picked up automatically by read_session.py; without
+it the pure-Python version below is used. While a read_session_core*.so is
+present it shadows this file, so delete or rebuild it after editing here.
+"""
+
+import gc
+import hashlib
+import json
+import multiprocessing
+import os
+import pickle
+import re
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields
+from operator import attrgetter
+from typing import Any
+
+# Prefer a C-accelerated decoder when one is installed; stdlib json is the
+# fallback so the script keeps working with zero dependencies. A plain
+# `uv run read_session.py` installs neither, so add `--with orjson` to use it.
+fast_loads: Callable[[bytes], Any] | None
+try:
+    import orjson
+
+    fast_loads = orjson.loads
+except ImportError:
+    try:
+        import ujson  # type: ignore
+
+        fast_loads = ujson.loads
+    except ImportError:
+        fast_loads = None
+
+
+def loads(line: bytes) -> Any:
+    """Decode one JSONL record.
+
+    The fast decoders reject lone surrogate escapes such as "\\ud83d", which
+    JSON.stringify writes when an emoji is cut in half; stdlib json accepts
+    them, so it is used as the fallback for any decode error. Integers wider
+    than 64 bits may come back as floats from orjson, which loses nothing:
+    JSON.stringify only writes numbers that fit in a double.
+    """
+    if fast_loads is None:
+        return json.loads(line)
+    try:
+        return fast_loads(line)
+    except ValueError:
+        return json.loads(line)
+
+
+READ_CHUNK_SIZE: int = 1 << 20
+
+
+# Optional turn fields, grouped by what it costs to extract them. Every turn
+# always carries role, timestamp, is_error and tool result/subagent metadata;
+# the groups below are only filled in when the output mode reads them.
+ALL_FIELDS: frozenset[str] = frozenset({"texts", "tool_calls", "thinking", "usage"})
+
+MODE_FIELDS: dict[str, frozenset[str]] = {
+    "conversation": frozenset({"texts", "tool_calls"}),
+    "toc": frozenset({"texts", "tool_calls", "usage"}),
+    "turn": ALL_FIELDS,
+    "issues": frozenset({"texts"}),
+    "overview": frozenset({"texts", "tool_calls", "usage"}),
+    "full": ALL_FIELDS,
+    "tools": frozenset({"texts", "tool_calls"}),
+    "costs": frozenset({"usage"}),
+    "subagents": frozenset({"tool_calls"}),
+}
+
+# Modes that only read a few kinds of records can reject most lines with a
+# byte scan before decoding them. A line is decoded only if it contains one of
+# the quoted tokens below; the match is deliberately loose (a false positive
+# just costs a normal parse), but anything that can affect the mode's output
+# always contains at least one of them. costs needs user messages for the
+# --offset/--limit numbering, assistant usage and subagent result usage.
+MODE_LINE_FILTERS: dict[str, re.Pattern[bytes]] = {
+    "costs": re.compile(rb'"(?:usage|user|session|model_change|thinking_level_change)"'),
+    "subagents": re.compile(rb'"(?:subagent|session|model_change|thinking_level_change)"'),
+}
+
+
+@dataclass(slots=True)
+class Turn:
+    """One message in the session, reduced to the fields the printers use."""
+
+    role: str
+    timestamp: Any
+    is_error: bool = False
+    texts: list[str] = field(default_factory=list)
+    tool_calls: list[dict[str, Any]] = field(default_factory=list)
+    thinking: list[str] = field(default_factory=list)
+    # Assistant turns with usage data
+    model: str = ""
+    provider: str = ""
+    usage: dict[str, Any] | None = None
+    stop_reason: str = ""
+    # Tool results
+    tool_call_id: str = ""
+    tool_name: str = ""
+    subagent_details: dict[str, Any] | None = None
+    subagent_call_args: dict[str, Any] | None = None
+
+    def __reduce__(self) -> tuple[type["Turn"], tuple[Any, ...]]:
+        # Pickle as a plain constructor call; the default slots protocol goes
+        # through Python-level __getstate__/__setstate__ and is ~2x slower.
+        return Turn, TURN_FIELDS(self)
+
+
+TURN_FIELDS = attrgetter(*(f.name for f in fields(Turn)))
+
+
+def iter_lines(path: str, start: int = 0, end: int = -1) -> Iterator[bytes]:
+    """Yield raw JSONL lines as bytes, reading the file in large binary chunks.
+
+    Only each new chunk is searched for newlines; the tail of a line that
+    spans chunks is collected in pieces and joined once its newline arrives,
+    so every byte is scanned and copied a constant number of times.
+    start/end restrict the read to a byte range (end=-1 reads to EOF); both
+    must sit on line starts.
+    """
+    with open(path, "rb", buffering=0) as f:
+        if start:
+            f.seek(start)
+        remaining = end - start if end >= 0 else -1
+        pending: list[bytes] = []
+        while remaining:
+            size = READ_CHUNK_SIZE if remaining < 0 else min(READ_CHUNK_SIZE, remaining)
+            chunk = f.read(size)
+            if not chunk:
+                break
+            if remaining > 0:
+                remaining -= len(chunk)
+            pos = 0
+            nl = chunk.find(b"\n")
+            while nl != -1:
+                if pending:
+                    pending.append(chunk[pos:nl])
+                    yield b"".join(pending)
+                    pending = []
+                else:
+                    yield chunk[pos:nl]
+                pos = nl + 1
+                nl = chunk.find(b"\n", pos)
+            if pos < len(chunk):
+                pending.append(chunk[pos:])
+        if pending:
+            yield b"".join(pending)
+
+
+@contextmanager
+def gc_paused() -> Iterator[None]:
+    """Pause the cyclic GC while unpickling parsed sessions.
+
+    Unpickling allocates a container per turn, text list and tool call, which
+    keeps triggering collections that find nothing: the graph is acyclic.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+# Minimum bytes per worker process: below this, starting a worker and
+# pickling its turns back costs more than decoding the range in-process.
+PARALLEL_MIN_BYTES = 16 << 20
+
+
+def available_cpus() -> int:
+    """CPUs this process may run on, honouring affinity masks where supported."""
+    sched_getaffinity = getattr(os, "sched_getaffinity", None)
+    if sched_getaffinity is not None:
+        return len(sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def parse_session(
+    path: str,
+    field_groups: frozenset[str] = ALL_FIELDS,
+    line_filter: re.Pattern[bytes] | None = None,
+    workers: int = 1,
+) -> tuple[dict[str, Any], list[dict[str, Any]], list[Turn]]:
+    """Parse a session file into (metadata, events, turns).
+
+    Message entries are converted to turns as they are read, extracting only
+    the field groups named in field_groups (see MODE_FIELDS). Subagent tool
+    results get the arguments of their originating tool call attached as
+    subagent_call_args, matched by tool call id. If line_filter is given
+    (see MODE_LINE_FILTERS), lines it does not match are skipped undecoded.
+
+    With workers > 1 (0 = one per available CPU), the file is split into
+    line-aligned byte ranges decoded in a process pool, using at most one
+    worker per PARALLEL_MIN_BYTES of input. Parsing is serial by default:
+    returning decoded turns from workers costs about a quarter of a serial
+    parse, so the pool only pays off on large sessions with several cores.
+    """
+    workers = min(workers or available_cpus(), os.path.getsize(path) // PARALLEL_MIN_BYTES)
+    if workers > 1:
+        jobs = [(path, start, end, field_groups, line_filter) for start, end in split_ranges(path, workers)]
+        with gc_paused(), multiprocessing.Pool(len(jobs)) as pool:
+            parts = pool.map(parse_range, jobs)
+        metadata: dict[str, Any] = {}
+        events: list[dict[str, Any]] = []
+        turns: list[Turn] = []
+        for part_metadata, part_events, part_turns in parts:
+            metadata = part_metadata or metadata
+            events.extend(part_events)
+            turns.extend(part_turns)
+    else:
+        metadata, events, turns = parse_lines(iter_lines(path), field_groups, line_filter)
+
+    link_subagent_calls(turns)
+    return metadata, events, turns
+
+
+def split_ranges(path: str, count: int) -> list[tuple[int, int]]:
+    """Split a file into up to count byte ranges that each start on a line."""
+    size = os.path.getsize(path)
+    bounds = [0]
+    with open(path, "rb") as f:
+        for i in range(1, count):
+            if bounds[-1] >= size:
+                break
+            f.seek(max(size * i // count, bounds[-1]))
+            f.readline()
+            bounds.append(f.tell())
+    bounds.append(size)
+    return [(lo, hi) for lo, hi in zip(bounds, bounds[1:]) if hi > lo]
+
+
+def parse_range(
+    job: tuple[str, int, int, frozenset[str], re.Pattern[bytes] | None],
+) -> tuple[dict[str, Any], list[dict[str, Any]], list[Turn]]:
+    """Process pool entry point: parse one byte range of a session file."""
+    path, start, end, field_groups, line_filter = job
+    return parse_lines(iter_lines(path, start, end), field_groups, line_filter)
+
+
+def parse_lines(
+    lines: Iterator[bytes], field_groups: frozenset[str], line_filter: re.Pattern[bytes] | None
+) -> tuple[dict[str, Any], list[dict[str, Any]], list[Turn]]:
+    """Decode JSONL lines into (metadata, events, turns)."""
+    metadata: dict[str, Any] = {}
+    events: list[dict[str, Any]] = []
+    turns: list[Turn] = []
+
+    # Hot loop: bind the callables it uses to locals once up front.
+    _loads = loads
+    _extract_turn = extract_turn
+    line_matches = line_filter.search if line_filter else None
+    events_append = events.append
+    turns_append = turns.append
+
+    for line in lines:
+        # The shortest valid record is "{}"; anything shorter is a blank line
+        # or a stray "\r". isspace() stops at the first non-space byte.
+        if len(line) < 2 or line.isspace():
+            continue
+        if line_matches and not line_matches(line):
+            continue
+        obj = _loads(line)
+        t = obj.get("type")
+
+        if t == "session":
+            metadata = obj
+        elif t in ("model_change", "thinking_level_change"):
+            events_append(obj)
+        elif t == "message":
+            turns_append(_extract_turn(obj, field_groups))
+
+    return metadata, events, turns
+
+
+def link_subagent_calls(turns: list[Turn]) -> None:
+    """Attach each subagent call's arguments to its tool result turn."""
+    pending_subagent_calls: dict[str, Any] = {}
+    for turn in turns:
+        for tc in turn.tool_calls:
+            if tc["name"] == "subagent":
+                pending_subagent_calls[tc["id"]] = tc["arguments"]
+        if turn.subagent_details:
+            turn.subagent_call_args = pending_subagent_calls.pop(turn.tool_call_id, {})
+
+
+# Bump when Turn or the parse output changes shape, to invalidate old caches.
+CACHE_VERSION = 2
+
+
+def cache_path(path: str) -> str:
+    """Location of the parse cache for a session file.
+
+    Caches live in the user's own cache directory, named by a hash of the
+    session's real path, never next to the session: a pickle written by
+    someone else must not be loaded.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    digest = hashlib.sha256(os.path.realpath(path).encode()).hexdigest()
+    return os.path.join(cache_home, "pi-session-reader", f"{digest}.idx")
+
+
+def load_session(
+    path: str,
+    field_groups: frozenset[str] = ALL_FIELDS,
+    line_filter: re.Pattern[bytes] | None = None,
+    use_cache: bool = False,
+    workers: int = 1,
+) -> tuple[dict[str, Any], list[dict[str, Any]], list[Turn]]:
+    """Parse a session, optionally reusing a pickled parse from cache_path().
+
+    The cache is keyed on the session's real path, mtime and size, and holds
+    a full parse so any mode can reuse it. A miss parses only what the mode
+    needs and writes the cache only if that was a full parse (no field
+    groups or lines skipped). Unreadable or stale caches are ignored, and
+    failing to write one is not an error.
+    """
+    if not use_cache:
+        return parse_session(path, field_groups, line_filter, workers)
+
+    idx_path = cache_path(path)
+    st = os.stat(path)
+    key = (CACHE_VERSION, os.path.realpath(path), st.st_mtime_ns, st.st_size)
+
+    try:
+        with gc_paused(), open(idx_path, "rb") as f:
+            if pickle.load(f) == key:
+                parsed: tuple[dict[str, Any], list[dict[str, Any]], list[Turn]] = pickle.load(f)
+                return parsed
+    except Exception:
+        # Missing, truncated or stale cache files fail in many ways; reparse.
+        pass
+
+    parsed = parse_session(path, field_groups, line_filter, workers)
+    if field_groups != ALL_FIELDS or line_filter is not None:
+        return parsed
+
+    tmp_path = f"{idx_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(idx_path), mode=0o700, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            pickle.dump(key, f, protocol=5)
+            pickle.dump(parsed, f, protocol=5)
+        os.replace(tmp_path, idx_path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+    return parsed
+
+
+def extract_subagent_details(msg: dict[str, Any]) -> dict[str, Any] | None:
+    if msg.get("role") != "toolResult" or msg.get("toolName") != "subagent":
+        return None
+    return msg.get("details")
+
+
+def extract_turn(entry: dict[str, Any], field_groups: frozenset[str] = ALL_FIELDS) -> Turn:
+    """Convert a raw message entry into a structured turn.
+
+    Only the optional field groups named in field_groups are extracted; the
+    others are left empty.
+    """
+    msg = entry.get("message", {})
+    role = msg.get("role", "")
+    content = msg.get("content", "")
+    timestamp = entry.get("timestamp", msg.get("timestamp", ""))
+
+    need_texts = "texts" in field_groups
+    need_tools = "tool_calls" in field_groups
+    need_thinking = "thinking" in field_groups
+
+    turn = Turn(role=role, timestamp=timestamp, is_error=msg.get("isError", False))
+    texts_append = turn.texts.append
+
+    if role == "assistant" and "usage" in field_groups:
+        usage = msg.get("usage", {})
+        if usage:
+            turn.model = msg.get("model", "")
+            turn.provider = msg.get("provider", "")
+            turn.usage = usage
+            turn.stop_reason = msg.get("stopReason", "")
+
+    if role == "toolResult":
+        turn.tool_call_id = msg.get("toolCallId", "")
+        turn.tool_name = msg.get("toolName", "")
+        if need_texts:
+            if isinstance(content, list):
+                for item in content:
+                    if isinstance(item, dict) and item.get("type") == "text":
+                        texts_append(item.get("text", ""))
+            elif isinstance(content, str) and content.strip():
+                texts_append(content)
+
+        subagent_details = extract_subagent_details(msg)
+        if subagent_details:
+            turn.subagent_details = subagent_details
+    elif isinstance(content, str):
+        if need_texts and content.strip():
+            texts_append(content)
+    elif isinstance(content, list) and (need_texts or need_tools or need_thinking):
+        tools_append = turn.tool_calls.append
+        thinking_append = turn.thinking.append
+        for item in content:
+            if not isinstance(item, dict):
+                continue
+            get = item.get
+            item_type = get("type", "")
+
+            if item_type == "text":
+                if need_texts and get("text", "").strip():
+                    texts_append(item["text"])
+            elif item_type == "toolCall":
+                if need_tools:
+                    tools_append(
+                        {
+                            "id": get("id", ""),
+                            "name": get("name", ""),
+                            "arguments": get("arguments", {}),
+                        }
+                    )
+            elif item_type == "thinking":
+                thinking_text = get("thinking", "")
+                if need_thinking and thinking_text:
+                    thinking_append(thinking_text)
+
+    return turn